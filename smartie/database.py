@@ -65,8 +65,9 @@ class SMARTAttribute:
         """
         The current value, run through any provided processor.
         """
-        if self.processor is not None:
-            return self.processor(self.current_value)
+        processor = self.processor
+        if processor is not None:
+            return processor(self.current_value)
         return self.current_value
 
     @property
@@ -74,8 +75,9 @@ class SMARTAttribute:
         """
         The worst value, run through any provided processor.
         """
-        if self.processor is not None:
-            return self.processor(self.worst_value)
+        processor = self.processor
+        if processor is not None:
+            return processor(self.worst_value)
         return self.worst_value
 
 
@@ -8,8 +8,9 @@ import itertools
 import ctypes
 import platform
 import os
+from concurrent import futures
 from pathlib import Path
-from typing import Iterable, List, Optional, Union
+from typing import Dict, Iterable, List, Optional, Union
 
 
 class Device(abc.ABC):
@@ -33,6 +34,9 @@ class Device(abc.ABC):
 
     def __init__(self, path: Union[Path, str]):
         self.path = str(path)
+        # Encoded once so repeated open/close cycles (such as during device
+        # enumeration) don't re-run the filesystem codec.
+        self._encoded_path = os.fsencode(self.path)
         self.fd = None
 
     def __repr__(self):
@@ -114,6 +118,41 @@ def get_device(path: Union[Path, str]) -> Device:
         raise NotImplementedError("Device not implemented for this platform.")
 
 
+def scan_smart(
+    devices: Iterable[Device], *, max_workers: Optional[int] = None
+) -> Dict[Device, dict]:
+    """
+    Reads the SMART table from each of the given (unopened) devices
+    concurrently, returning a mapping of device to its SMART table.
+
+    Each device is opened and closed in a worker thread. The blocking
+    passthrough calls release the GIL, so total wall time is bounded by the
+    slowest device rather than the sum of every round-trip.
+
+    .. code-block:: python
+
+        for device, smart_table in scan_smart(get_all_devices()).items():
+            print(device.path, smart_table)
+
+    :param devices: The devices to poll.
+    :param max_workers: The maximum number of worker threads to use.
+                        Defaults to one per device, capped at 32.
+    """
+
+    def _poll(device: Device):
+        with device:
+            return device.smart_table
+
+    devices = list(devices)
+    if not devices:
+        return {}
+
+    with futures.ThreadPoolExecutor(
+        max_workers=max_workers or min(len(devices), 32)
+    ) as executor:
+        return dict(zip(devices, executor.map(_poll, devices)))
+
+
 def get_all_devices() -> Iterable[Device]:
     """
     Yields all the devices detected on the host.
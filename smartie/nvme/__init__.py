@@ -59,20 +59,38 @@ class NVMeResponse:
 
 
 class NVMeDevice(Device, abc.ABC):
+    #: Response buffers reused between calls, along with their addresses so
+    #: we don't pay for a ctypes.addressof() on every command.
+    _identify_buf: Optional[NVMeIdentifyResponse] = None
+    _identify_buf_addr: int = 0
+    _smart_buf: Optional[SMARTPageResponse] = None
+    _smart_buf_addr: int = 0
+
     @classmethod
-    def parse_status_field(cls, status_blob) -> Optional[NVMeCQEStatusField]:
+    def parse_status_field(cls, status: int) -> Optional[NVMeCQEStatusField]:
         """
         Parses the command status field from an NVMe command, raising a
         :class:`smartie.nvme.errors.NVMeStatusFieldError` if an error occurred.
 
-        :param status_blob: A bytes/bytearray (or similar) object containing
-                            the unparsed sense response.
+        :param status: The raw 16-bit integer value of the Completion Queue
+                       Entry status field.
         """
-        status_field = NVMeCQEStatusField.from_buffer_copy(status_blob)
-        if status_field.status_code != 0 or status_field.status_code_type != 0:
+        # Validate with plain integer math before we pay for a ctypes
+        # bitfield structure - the happy path only needs these two values.
+        status_code = status & 0xFF
+        status_code_type = (status >> 8) & 0x07
+
+        status_field = NVMeCQEStatusField(
+            status_code=status_code,
+            status_code_type=status_code_type,
+            cmd_retry_delay=(status >> 11) & 0x03,
+            more=(status >> 13) & 0x01,
+            do_not_retry=(status >> 14) & 0x01,
+        )
+        if status_code != 0 or status_code_type != 0:
             raise NVMeStatusFieldError(
-                status_field.status_code,
-                status_field.status_code_type,
+                status_code,
+                status_code_type,
                 status_field=status_field,
             )
         return status_field
@@ -85,12 +103,21 @@ class NVMeDevice(Device, abc.ABC):
         """
         Returns the parsed IDENTIFY results for CNS 01h, which contains
         the controller information.
+
+        .. note::
+
+            The returned structure is reused between calls to this method
+            on the same device.
         """
-        data = NVMeIdentifyResponse()
+        data = self._identify_buf
+        if data is None:
+            data = self._identify_buf = NVMeIdentifyResponse()
+            self._identify_buf_addr = ctypes.addressof(data)
+
         response = self.issue_admin_command(
             NVMeAdminCommand(
                 opcode=NVMeAdminCommands.IDENTIFY,
-                addr=ctypes.addressof(data),
+                addr=self._identify_buf_addr,
                 data_len=ctypes.sizeof(data),
                 cdw10=1,
             )
@@ -127,7 +154,29 @@ class NVMeDevice(Device, abc.ABC):
         return data, response
 
     def smart(self):
-        return self.read_log_page(0x02, SMARTPageResponse())
+        """
+        Returns the parsed SMART / Health Information log page.
+
+        .. note::
+
+            The returned structure is reused between calls to this method
+            on the same device.
+        """
+        data = self._smart_buf
+        if data is None:
+            data = self._smart_buf = SMARTPageResponse()
+            self._smart_buf_addr = ctypes.addressof(data)
+
+        response = self.issue_admin_command(
+            NVMeAdminCommand(
+                opcode=NVMeAdminCommands.GET_LOG_PAGE,
+                addr=self._smart_buf_addr,
+                data_len=ctypes.sizeof(data),
+                nsid=0xFFFFFFFF,
+                cdw10=0x02 | (((ctypes.sizeof(data) // 4) - 1) << 16),
+            )
+        )
+        return data, response
 
     @property
     def smart_table(self) -> dict[str, any]:
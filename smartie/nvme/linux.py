@@ -1,13 +1,15 @@
 import ctypes
 import os
+from typing import Tuple
 
-from smartie.nvme import (
-    NVMeDevice,
-    NVMeResponse,
-    local_byteorder,
-)
+from smartie.nvme import NVMeDevice, NVMeResponse
 from smartie.platforms.linux import get_libc
-from smartie.nvme.structures import IOCTL_NVMe_ADMIN_CMD, NVMeAdminCommand
+from smartie.nvme.structures import (
+    IOCTL_NVMe_ADMIN_CMD,
+    NVMeAdminCommand,
+    NVMeAdminCommands,
+    SMARTPageResponse,
+)
 
 
 class LinuxNVMeDevice(NVMeDevice):
@@ -15,11 +17,15 @@ class LinuxNVMeDevice(NVMeDevice):
     Represents an NVMe device on a Linux system.
     """
 
+    #: A preallocated GET_LOG_PAGE command reused by :meth:`_fast_smart`.
+    _smart_cmd = None
+
     def __enter__(self):
         if self.fd is not None:
             raise IOError("Device already open.")
 
-        self.fd = os.open(self.path, os.O_RDONLY | os.O_NONBLOCK)
+        self.fd = os.open(self._encoded_path, os.O_RDONLY | os.O_NONBLOCK)
+        self._ioctl = get_libc().ioctl
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -38,9 +44,7 @@ class LinuxNVMeDevice(NVMeDevice):
             raise OSError(f"NVMe Admin command failed with error {result}")
 
         # Status is in the upper 16 bits of the result
-        status_field = self.parse_status_field(
-            command.result.to_bytes(2, local_byteorder)
-        )
+        status_field = self.parse_status_field(command.result)
 
         return NVMeResponse(
             succeeded=status_field.status_code == 0,
@@ -50,3 +54,44 @@ class LinuxNVMeDevice(NVMeDevice):
             bytes_transferred=None,
             platform_header=None,
         )
+
+    def _fast_smart(self) -> Tuple[SMARTPageResponse, NVMeResponse]:
+        """
+        A flattened equivalent of :meth:`smart` for tight polling loops.
+
+        The GET_LOG_PAGE command and response buffer are built once and
+        reused, and the ioctl is issued directly from this method rather
+        than going through :meth:`read_log_page` and
+        :meth:`issue_admin_command`.
+        """
+        command = self._smart_cmd
+        if command is None:
+            data = self._smart_buf
+            if data is None:
+                data = self._smart_buf = SMARTPageResponse()
+                self._smart_buf_addr = ctypes.addressof(data)
+
+            command = self._smart_cmd = NVMeAdminCommand(
+                opcode=NVMeAdminCommands.GET_LOG_PAGE,
+                addr=self._smart_buf_addr,
+                data_len=ctypes.sizeof(data),
+                nsid=0xFFFFFFFF,
+                cdw10=0x02 | (((ctypes.sizeof(data) // 4) - 1) << 16),
+            )
+
+        result = self._ioctl(
+            self.fd, IOCTL_NVMe_ADMIN_CMD, ctypes.byref(command)
+        )
+        if result < 0:
+            raise OSError(f"NVMe Admin command failed with error {result}")
+
+        status_field = self.parse_status_field(command.result)
+
+        return self._smart_buf, NVMeResponse(
+            succeeded=status_field.status_code == 0,
+            command_spec=command.result,
+            status_field=status_field,
+            command=command,
+            bytes_transferred=None,
+            platform_header=None,
+        )
@@ -10,4 +10,10 @@ from functools import cache
 def get_libc():
     # Opens the libc.so, which can be quite a slow process, and
     # saves it for future use.
-    return ctypes.CDLL("libc.so.6", use_errno=True)
+    libc = ctypes.CDLL("libc.so.6", use_errno=True)
+    # Declaring the signature up front lets ctypes skip probing the type
+    # of every argument on each call. ioctl() is variadic, but every call
+    # this library makes passes exactly (fd, request, pointer).
+    libc.ioctl.argtypes = (ctypes.c_int, ctypes.c_ulong, ctypes.c_void_p)
+    libc.ioctl.restype = ctypes.c_int
+    return libc
@@ -1,4 +1,5 @@
 import ctypes
+from ctypes import wintypes
 from functools import cache
 
 
@@ -6,4 +7,31 @@ from functools import cache
 def get_kernel32():
     # Opens the Kernel32.dll, which can be quite a slow process, and
     # saves it for future use.
-    return ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    # Declaring the signatures up front lets ctypes skip probing the type
+    # of every argument on each call. It also keeps 64-bit HANDLEs from
+    # being truncated by the default c_int restype.
+    kernel32.CreateFileW.argtypes = (
+        wintypes.LPCWSTR,
+        wintypes.DWORD,
+        wintypes.DWORD,
+        ctypes.c_void_p,
+        wintypes.DWORD,
+        wintypes.DWORD,
+        wintypes.HANDLE,
+    )
+    kernel32.CreateFileW.restype = wintypes.HANDLE
+    kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+    kernel32.CloseHandle.restype = wintypes.BOOL
+    kernel32.DeviceIoControl.argtypes = (
+        wintypes.HANDLE,
+        wintypes.DWORD,
+        ctypes.c_void_p,
+        wintypes.DWORD,
+        ctypes.c_void_p,
+        wintypes.DWORD,
+        ctypes.POINTER(wintypes.DWORD),
+        ctypes.c_void_p,
+    )
+    kernel32.DeviceIoControl.restype = wintypes.BOOL
+    return kernel32
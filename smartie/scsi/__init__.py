@@ -1,8 +1,10 @@
 __all__ = ("SCSIDevice", "SCSIResponse")
 
 import abc
+import copy
 import ctypes
-from dataclasses import replace, dataclass
+import struct
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple, Union, Any
 
 import smartie.structures
@@ -24,11 +26,99 @@ from smartie.scsi.structures import (
     InquiryCommand,
     InquiryResponse,
     OperationCode,
+    SmartDataEntry,
     SmartDataResponse,
+    SmartThresholdEntry,
     SmartThresholdResponse,
     Command12,
 )
-from smartie.structures import swap_bytes
+from smartie.structures import ata_string, compiled_struct
+
+
+#: Sense keys that don't indicate a real error - NO SENSE, RECOVERED ERROR
+#: and COMPLETED - packed into a bitmask for a single-shift membership test.
+_BENIGN_SENSE_KEYS = (1 << 0x00) | (1 << 0x01) | (1 << 0x0F)
+
+#: Maps a sense error code to the structure that parses it.
+_SENSE_PARSERS = {
+    0x70: FixedFormatSense,
+    0x71: FixedFormatSense,
+    0x72: DescriptorFormatSense,
+    0x73: DescriptorFormatSense,
+}
+
+
+#: The protocol field value for PIO data-in passthrough commands.
+_PIO_DATA_IN_PROTOCOL = ATAProtocol.PIO_DATA_IN << 1
+#: The command flags shared by every data-in passthrough command this
+#: library issues. Assigning the singleton into a Command16 copies it, so
+#: sharing one instance is safe.
+_PIO_DATA_IN_FLAGS = CommandFlags(
+    t_length=CommandFlags.Length.IN_SECTOR_COUNT,
+    byt_blok=True,
+    t_dir=True,
+    ck_cond=True,
+)
+
+
+def _build_smart_command16(feature: ATASmartFeature) -> Command16:
+    """
+    Builds a SMART passthrough :class:`Command16` for the given feature.
+    """
+    return Command16(
+        operation_code=OperationCode.COMMAND_16,
+        protocol=_PIO_DATA_IN_PROTOCOL,
+        command=ATACommands.SMART,
+        flags=_PIO_DATA_IN_FLAGS,
+        features=feature,
+    ).set_lba(0xC24F00)
+
+
+#: Prebuilt SMART commands. Constructing a Command16 keyword-by-keyword
+#: walks a ctypes descriptor per field, so the polling hot paths instead
+#: clone these templates with a single 16-byte copy.
+_SMART_READ_DATA_CMD = _build_smart_command16(
+    ATASmartFeature.SMART_READ_DATA
+)
+_SMART_READ_THRESHOLDS_CMD = _build_smart_command16(
+    ATASmartFeature.SMART_READ_THRESHOLDS
+)
+#: Prebuilt ATA IDENTIFY and SCSI INQUIRY commands, cloned per call for
+#: the same reason as the SMART templates above.
+_IDENTIFY_CMD = Command16(
+    operation_code=OperationCode.COMMAND_16,
+    protocol=_PIO_DATA_IN_PROTOCOL,
+    flags=_PIO_DATA_IN_FLAGS,
+    command=ATACommands.IDENTIFY,
+)
+_INQUIRY_CMD = InquiryCommand(
+    operation_code=OperationCode.INQUIRY, allocation_length=96
+)
+
+
+#: The 12-byte on-wire layout of a SmartDataEntry (id, flags, current,
+#: worst, then 7 bytes we don't use). Unpacking entries from the raw
+#: buffer in one C loop is much cheaper than reading each field through
+#: ctypes descriptors.
+_SMART_ATTRIBUTE_STRUCT = struct.Struct("<BHBB7x")
+#: The 12-byte layout of a SmartThresholdEntry (attribute_id, value, then
+#: 10 reserved bytes).
+_SMART_THRESHOLD_STRUCT = struct.Struct("<BB10x")
+
+# The hand-written formats above use pad bytes to skip the fields the
+# parse loops never read; make sure they stay in step with the full
+# formats derived from the structure declarations.
+assert _SMART_ATTRIBUTE_STRUCT.size == compiled_struct(SmartDataEntry).size
+assert _SMART_THRESHOLD_STRUCT.size == compiled_struct(SmartThresholdEntry).size
+
+
+def _field_bytes(source: ctypes.Structure, name: str) -> bytes:
+    """
+    Extracts the raw bytes of a fixed-size field on `source` with a single
+    C-level copy, skipping per-element iteration over the ctypes array.
+    """
+    field = getattr(type(source), name)
+    return ctypes.string_at(ctypes.addressof(source) + field.offset, field.size)
 
 
 @dataclass
@@ -64,6 +154,30 @@ class SCSIResponse:
 
 
 class SCSIDevice(Device, abc.ABC):
+    #: Memoized results of the last INQUIRY and IDENTIFY commands. These
+    #: responses don't change for the life of an open device, and several
+    #: properties (``model``, ``serial``, ``smart_table``) would otherwise
+    #: each issue their own passthrough ioctl.
+    _inquiry_cache: Optional[Tuple[InquiryResponse, "SCSIResponse"]] = None
+    _identify_cache: Optional[Tuple[IdentifyResponse, "SCSIResponse"]] = None
+    #: A reusable 512-byte buffer for the raw IDENTIFY response, so a
+    #: long-running monitor doesn't reallocate it on every (uncached) read.
+    _identify_buf: Optional[ctypes.Array] = None
+    #: A 256-slot table of SMARTAttribute templates for this drive, indexed
+    #: by attribute id. Built once per device - merging the drive database
+    #: entry runs regexes over the model string, and attribute ids are
+    #: single bytes, so a flat list beats a dict lookup in the parse loop.
+    _attr_templates: Optional[List[Optional[SMARTAttribute]]] = None
+
+    def refresh(self):
+        """
+        Discards the cached INQUIRY and IDENTIFY responses, forcing the next
+        caller to re-issue the commands to the device.
+        """
+        self._inquiry_cache = None
+        self._identify_cache = None
+        self._attr_templates = None
+
     @classmethod
     def parse_sense(
         cls, sense_blob
@@ -75,25 +189,26 @@ class SCSIDevice(Device, abc.ABC):
         Will return either a :class:`structures.FixedFormatSense` or a
         :class:`structures.DescriptorFormatSense` depending on the error code.
 
-        :param sense_blob: A bytearray (or similar) object containing the
-                           unparsed sense response.
+        The returned structure is a zero-copy view over `sense_blob`, which
+        must therefore be writable (a bytearray or ctypes buffer, not bytes)
+        and outlive the returned structure.
+
+        :param sense_blob: A writable buffer (such as a bytearray) containing
+                           the unparsed sense response.
         """
         error_code = sense_blob[0] & 0x7F
         if error_code == 0x00:
             return None
-        elif error_code in (0x70, 0x71):
-            sense = FixedFormatSense.from_buffer_copy(sense_blob)
-            if sense.sense_key not in (0x00, 0x01, 0x0F):
-                raise SenseError(sense.sense_key, sense=sense)
-            return sense
-        elif error_code in (0x72, 0x73):
-            sense = DescriptorFormatSense.from_buffer_copy(sense_blob)
-            if sense.sense_key not in (0x00, 0x01, 0x0F):
-                raise SenseError(sense.sense_key, sense=sense)
-            return sense
-        else:
+
+        parser = _SENSE_PARSERS.get(error_code)
+        if parser is None:
             raise SenseError(0, sense=sense_blob)
 
+        sense = parser.from_buffer(sense_blob)
+        if not (_BENIGN_SENSE_KEYS >> sense.sense_key) & 1:
+            raise SenseError(sense.sense_key, sense=sense)
+        return sense
+
     def issue_command(
         self,
         direction: Direction,
@@ -116,16 +231,21 @@ class SCSIDevice(Device, abc.ABC):
     def inquiry(self) -> Tuple[InquiryResponse, SCSIResponse]:
         """
         Issues a standard SCSI INQUIRY command.
+
+        The response is cached for the life of the device - use
+        :meth:`refresh()` to force a re-read.
         """
+        if self._inquiry_cache is not None:
+            return self._inquiry_cache
+
         inquiry = InquiryResponse()
 
-        inquiry_command = InquiryCommand(
-            operation_code=OperationCode.INQUIRY, allocation_length=96
-        )
+        inquiry_command = InquiryCommand.from_buffer_copy(_INQUIRY_CMD)
 
         response = self.issue_command(Direction.FROM, inquiry_command, inquiry)
 
-        return inquiry, response
+        self._inquiry_cache = (inquiry, response)
+        return self._inquiry_cache
 
     def identify(
         self, try_atapi_on_failure=True
@@ -133,22 +253,30 @@ class SCSIDevice(Device, abc.ABC):
         """
         Issues a standard ATA IDENTIFY command.
 
+        The response is cached for the life of the device - use
+        :meth:`refresh()` to force a re-read.
+
         :param try_atapi_on_failure: If True, will try an ATAPI IDENTIFY command
                                         if the ATA IDENTIFY command fails.
         """
-        identity = ctypes.create_string_buffer(b"\x00", 512)
-
-        command16 = Command16(
-            operation_code=OperationCode.COMMAND_16,
-            protocol=ATAProtocol.PIO_DATA_IN << 1,
-            flags=CommandFlags(
-                t_length=CommandFlags.Length.IN_SECTOR_COUNT,
-                byt_blok=True,
-                t_dir=True,
-                ck_cond=True,
-            ),
-            command=ATACommands.IDENTIFY,
-        )
+        if self._identify_cache is not None:
+            return self._identify_cache
+
+        identity = self._identify_buf
+        if identity is None:
+            # A c_ubyte array rather than a string buffer - it's the same
+            # 512 raw bytes, but without the NUL terminator a string buffer
+            # tacks on, so sizeof() matches the transfer length exactly.
+            # The drive cannot be asked to fill an IdentifyResponse directly:
+            # the structure only maps the leading fields of the 512-byte
+            # sector, and the device would write past its end.
+            identity = self._identify_buf = (ctypes.c_ubyte * 512)()
+        else:
+            ctypes.memset(identity, 0, 512)
+
+        # Cloned rather than shared - the ATAPI fallback below mutates the
+        # command byte.
+        command16 = Command16.from_buffer_copy(_IDENTIFY_CMD)
 
         try:
             response = self.issue_command(Direction.FROM, command16, identity)
@@ -162,7 +290,14 @@ class SCSIDevice(Device, abc.ABC):
             command16.command = ATAPICommands.IDENTIFY
             response = self.issue_command(Direction.FROM, command16, identity)
 
-        return IdentifyResponse.from_buffer(identity), response
+        # from_buffer_copy, not from_buffer - the scratch buffer is zeroed
+        # and rewritten on the next (post-refresh) read, and the cached
+        # response must not be a view into it.
+        self._identify_cache = (
+            IdentifyResponse.from_buffer_copy(identity),
+            response,
+        )
+        return self._identify_cache
 
     @property
     def model(self) -> Optional[str]:
@@ -170,15 +305,15 @@ class SCSIDevice(Device, abc.ABC):
         Returns the model name of the device.
         """
         identity, response = self.identify()
-        v = swap_bytes(identity.model_number).strip(b" \x00").decode()
+        v = ata_string(_field_bytes(identity, "model_number"))
         # If we didn't get anything at all back from an ATA IDENTIFY, try an
         # old fashion SCSI INQUIRY.
         if not v:
             inquiry, response = self.inquiry()
             v = (
-                bytearray(inquiry.product_identification)
+                _field_bytes(inquiry, "product_identification")
                 .strip(b" \x00")
-                .decode()
+                .decode("ascii", "replace")
             )
         return v
 
@@ -188,12 +323,16 @@ class SCSIDevice(Device, abc.ABC):
         Returns the serial number of the device.
         """
         identity, response = self.identify()
-        v = swap_bytes(identity.serial_number).strip(b" \x00").decode()
+        v = ata_string(_field_bytes(identity, "serial_number"))
         # If we didn't get anything at all back from an ATA IDENTIFY, try an
         # old fashion SCSI INQUIRY.
         if not v:
             inquiry, response = self.inquiry()
-            v = bytearray(inquiry.vendor_specific_1).strip(b" \x00").decode()
+            v = (
+                _field_bytes(inquiry, "vendor_specific_1")
+                .strip(b" \x00")
+                .decode("ascii", "replace")
+            )
         return v
 
     @property
@@ -225,18 +364,7 @@ class SCSIDevice(Device, abc.ABC):
         """
         thresholds = SmartThresholdResponse()
 
-        command16 = Command16(
-            operation_code=OperationCode.COMMAND_16,
-            protocol=ATAProtocol.PIO_DATA_IN << 1,
-            command=ATACommands.SMART,
-            flags=CommandFlags(
-                t_length=CommandFlags.Length.IN_SECTOR_COUNT,
-                byt_blok=True,
-                t_dir=True,
-                ck_cond=True,
-            ),
-            features=ATASmartFeature.SMART_READ_THRESHOLDS,
-        ).set_lba(0xC24F00)
+        command16 = Command16.from_buffer_copy(_SMART_READ_THRESHOLDS_CMD)
 
         response = self.issue_command(Direction.FROM, command16, thresholds)
         return thresholds, response
@@ -247,18 +375,7 @@ class SCSIDevice(Device, abc.ABC):
         """
         smart = SmartDataResponse()
 
-        command16 = Command16(
-            operation_code=OperationCode.COMMAND_16,
-            protocol=ATAProtocol.PIO_DATA_IN << 1,
-            command=ATACommands.SMART,
-            flags=CommandFlags(
-                t_length=CommandFlags.Length.IN_SECTOR_COUNT,
-                byt_blok=True,
-                t_dir=True,
-                ck_cond=True,
-            ),
-            features=ATASmartFeature.SMART_READ_DATA,
-        ).set_lba(0xC24F00)
+        command16 = Command16.from_buffer_copy(_SMART_READ_DATA_CMD)
 
         response = self.issue_command(Direction.FROM, command16, smart)
         return smart, response
@@ -271,37 +388,54 @@ class SCSIDevice(Device, abc.ABC):
         """
         Returns a parsed and processed dictionary of SMART attributes.
         """
-        drive_entry = get_drive_entry(self.get_filters())
+        templates = self._attr_templates
+        if templates is None:
+            drive_entry = get_drive_entry(self.get_filters())
+            templates = self._attr_templates = [None] * 256
+            for attribute_id, base in drive_entry.smart_attributes.items():
+                templates[attribute_id] = base
 
         thresholds, _ = self.smart_thresholds()
         p_thresholds = {}
-        for entry in thresholds.entries:
-            if entry.attribute_id == 0x00:
+        for attribute_id, value in _SMART_THRESHOLD_STRUCT.iter_unpack(
+            bytes(thresholds.entries)
+        ):
+            if attribute_id == 0x00:
                 break
-            p_thresholds[entry.attribute_id] = entry.value
+            p_thresholds[attribute_id] = value
 
         smart, _ = self.smart()
         result = {}
-        for entry in smart.attributes:
-            if entry.id == 0x00:
+        # Unpack the raw attribute table in bulk - going through the ctypes
+        # descriptors would cost several Python-level boundary crossings for
+        # every one of the (up to) 30 entries.
+        for attribute_id, flags, current, worst in (
+            _SMART_ATTRIBUTE_STRUCT.iter_unpack(bytes(smart.attributes))
+        ):
+            if attribute_id == 0x00:
                 break
 
-            result[entry.id] = replace(
-                drive_entry.smart_attributes.get(
-                    entry.id,
-                    SMARTAttribute(
-                        "UNKNOWN",
-                        id=entry.id,
-                        flags=entry.flags,
-                        current_value=entry.current,
-                        worst_value=entry.worst,
-                        threshold=p_thresholds.get(entry.id),
-                    ),
-                ),
-                flags=entry.flags,
-                current_value=entry.current,
-                worst_value=entry.worst,
-                threshold=p_thresholds.get(entry.id),
-            )
+            base = templates[attribute_id]
+            if base is None:
+                # Nothing known about this attribute - build the final
+                # object directly rather than constructing a placeholder
+                # just to immediately replace() it.
+                result[attribute_id] = SMARTAttribute(
+                    "UNKNOWN",
+                    id=attribute_id,
+                    flags=flags,
+                    current_value=current,
+                    worst_value=worst,
+                    threshold=p_thresholds.get(attribute_id),
+                )
+            else:
+                # copy.copy() skips the dataclass __init__ machinery that
+                # dataclasses.replace() re-runs for every attribute.
+                attr = copy.copy(base)
+                attr.flags = flags
+                attr.current_value = current
+                attr.worst_value = worst
+                attr.threshold = p_thresholds.get(attribute_id)
+                result[attribute_id] = attr
 
         return result
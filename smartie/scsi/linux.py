@@ -13,19 +13,46 @@ from smartie.scsi.structures import (
     StatusCode,
 )
 
+#: The Sense response can be in multiple formats, and we won't know which
+#: until we see the first byte, so the scratch buffer is sized for the
+#: larger of the two.
+_SENSE_SIZE = max(
+    ctypes.sizeof(FixedFormatSense),
+    ctypes.sizeof(DescriptorFormatSense),
+)
+
 
 class LinuxSCSIDevice(SCSIDevice):
     def __enter__(self):
         if self.fd is not None:
             raise IOError("Device already open.")
 
-        self.fd = os.open(self.path, os.O_RDONLY | os.O_NONBLOCK)
+        self.fd = os.open(self._encoded_path, os.O_RDONLY | os.O_NONBLOCK)
+        # Scratch space reused by every issue_command() call on this device,
+        # so polling loops don't allocate a fresh header and sense buffer per
+        # command. A c_ubyte array (rather than a string buffer) lets
+        # parse_sense() overlay the sense structure on it without a copy -
+        # which also means a returned sense structure is only valid until the
+        # next command is issued.
+        self._sense_buf = (ctypes.c_ubyte * _SENSE_SIZE)()
+        self._sg_io_header = SGIOHeader(
+            interface_id=83,  # Always 'S'
+            mx_sb_len=_SENSE_SIZE,
+            sbp=ctypes.addressof(self._sense_buf),
+            timeout=3000,
+        )
+        # Bound once so the hot path below doesn't resolve the libc handle
+        # and the ioctl attribute on every command.
+        self._ioctl = get_libc().ioctl
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         if self.fd is not None:
             os.close(self.fd)
             self.fd = None
+        # The cached INQUIRY/IDENTIFY responses are only valid while the
+        # device is open - it may be a different disk next time.
+        self.refresh()
         return False
 
     def issue_command(
@@ -36,36 +63,31 @@ class LinuxSCSIDevice(SCSIDevice):
         *,
         timeout: int = 3000,
     ) -> SCSIResponse:
-        # The Sense response can be in multiple formats, and we won't know
-        # what it is until we see the first byte.
-        raw_sense = ctypes.create_string_buffer(
-            b"\x00",
-            max(
-                ctypes.sizeof(FixedFormatSense),
-                ctypes.sizeof(DescriptorFormatSense),
-            ),
-        )
+        raw_sense = self._sense_buf
+        ctypes.memset(raw_sense, 0, _SENSE_SIZE)
 
         if data is None:
             data = ctypes.create_string_buffer(0)
 
-        sg_io_header = SGIOHeader(
-            interface_id=83,  # Always 'S'
-            dxfer_direction=direction,
-            cmd_len=ctypes.sizeof(command),
-            cmdp=ctypes.addressof(command),
-            dxfer_len=ctypes.sizeof(data),
-            dxferp=ctypes.addressof(data),
-            mx_sb_len=ctypes.sizeof(raw_sense),
-            sbp=ctypes.addressof(raw_sense),
-            timeout=timeout,
-        )
+        # Only the fields that vary between commands are patched on the
+        # preallocated header; interface_id and the sense pointers were set
+        # once in __enter__.
+        sg_io_header = self._sg_io_header
+        sg_io_header.dxfer_direction = direction
+        sg_io_header.cmd_len = ctypes.sizeof(command)
+        sg_io_header.cmdp = ctypes.addressof(command)
+        sg_io_header.dxfer_len = ctypes.sizeof(data)
+        sg_io_header.dxferp = ctypes.addressof(data)
+        # The default timeout was written into the template at __enter__;
+        # only pay for the ctypes field store when a caller overrides it.
+        if sg_io_header.timeout != timeout:
+            sg_io_header.timeout = timeout
 
         # We use libc instead of the builtin ioctl as the builtin can have
-        # issues with 64-bit pointers.
-        result = get_libc().ioctl(
-            self.fd, IOCTL_SG_IO, ctypes.byref(sg_io_header)
-        )
+        # issues with 64-bit pointers. ctypes also releases the GIL around
+        # the foreign call, so threads polling several devices block here
+        # concurrently - all Python-side setup happens before this point.
+        result = self._ioctl(self.fd, IOCTL_SG_IO, ctypes.byref(sg_io_header))
 
         if result != 0:
             raise OSError(ctypes.get_errno())
@@ -75,7 +97,7 @@ class LinuxSCSIDevice(SCSIDevice):
                 sg_io_header.status == StatusCode.GOOD
                 or sg_io_header.status == StatusCode.CONDITION_GOOD
             ),
-            sense=self.parse_sense(raw_sense.raw),
+            sense=self.parse_sense(raw_sense),
             platform_header=sg_io_header,
             command=command,
             bytes_transferred=sg_io_header.dxfer_len - sg_io_header.resid,
@@ -320,13 +320,14 @@ class Command16(ctypes.BigEndianStructure):
     ]
 
     def set_lba(self, lba: int):
-        lba = lba.to_bytes(6, byteorder="little")
-        self.lba_high_low = lba[3]
-        self.lba_low = lba[0]
-        self.lba_high_mid = lba[4]
-        self.lba_mid = lba[1]
-        self.lba_high_high = lba[5]
-        self.lba_high = lba[2]
+        # Shift-and-mask instead of int.to_bytes() - same little-endian
+        # byte split without allocating an intermediate bytes object.
+        self.lba_low = lba & 0xFF
+        self.lba_mid = (lba >> 8) & 0xFF
+        self.lba_high = (lba >> 16) & 0xFF
+        self.lba_high_low = (lba >> 24) & 0xFF
+        self.lba_high_mid = (lba >> 32) & 0xFF
+        self.lba_high_high = (lba >> 40) & 0xFF
 
         return self
 
@@ -405,6 +406,9 @@ class FixedFormatSense(ctypes.Structure):
     the first byte, `error_code`.
     """
 
+    # Packed so the multi-byte fields sit at their specified byte offsets -
+    # natively, `information` would be aligned to byte 4 instead of byte 3.
+    _pack_ = 1
     _fields_ = [
         ("error_code", ctypes.c_ubyte, 7),
         ("valid", ctypes.c_ubyte, 1),
@@ -431,6 +435,7 @@ class DescriptorFormatSense(ctypes.Structure):
     the first byte, `error_code`.
     """
 
+    _pack_ = 1
     _fields_ = [
         ("error_code", ctypes.c_ubyte, 7),
         ("valid", ctypes.c_ubyte, 1),
@@ -453,6 +458,7 @@ class IdentifyResponse(ctypes.Structure):
 
     # I don't have the willpower to implement this entire structure. If you
     # need a field, add it.
+    _pack_ = 1
     _fields_ = [
         # ('general_config', ctypes.c_ushort),
         ("reserved_1", ctypes.c_ushort, 1),
@@ -509,6 +515,10 @@ class SmartDataResponse(ctypes.Structure):
         :func:`smartie.smart.parse_smart_read_data()` for an example.
     """
 
+    # Packed so `extended_self_test_recommended_time_wide` sits at byte 375
+    # as specified - natively it was aligned to 376, which also pushed the
+    # checksum off byte 511.
+    _pack_ = 1
     _fields_ = [
         ("version", ctypes.c_ushort),
         ("attributes", SmartDataEntry * 30),
@@ -528,8 +538,8 @@ class SmartDataResponse(ctypes.Structure):
         ("conveyance_self_test_recommended_time", ctypes.c_ubyte),
         # Recommended time is in minutes.
         ("extended_self_test_recommended_time_wide", ctypes.c_short),
-        ("reserved_1", ctypes.c_ubyte * 8),
-        ("vendor_specific_2", ctypes.c_ubyte * 124),
+        ("reserved_1", ctypes.c_ubyte * 9),
+        ("vendor_specific_5", ctypes.c_ubyte * 125),
         ("data_checksum_structure", ctypes.c_ubyte),
     ]
 
@@ -539,6 +549,7 @@ class SmartThresholdEntry(ctypes.Structure):
     A single entry in the SMART READ_THRESHOLDS response.
     """
 
+    _pack_ = 1
     _fields_ = [
         ("attribute_id", ctypes.c_ubyte),
         ("value", ctypes.c_ubyte),
@@ -556,6 +567,7 @@ class SmartThresholdResponse(ctypes.Structure):
         the temperature at which the device will start throttling.
     """
 
+    _pack_ = 1
     _fields_ = [
         ("revision_number", ctypes.c_ushort),
         ("entries", SmartThresholdEntry * 30),
@@ -1,4 +1,5 @@
 import ctypes
+from ctypes import wintypes
 from typing import Union
 
 from smartie.scsi import SCSIDevice, SCSIResponse
@@ -10,16 +11,38 @@ from smartie.scsi.structures import (
     SCSIPassThroughDirectWithBuffer,
 )
 
+#: What CreateFileW's INVALID_HANDLE_VALUE looks like once it has been
+#: round-tripped through a HANDLE restype (an unsigned pointer-sized int).
+_INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+
+#: Maps a platform-agnostic Direction onto the SCSI_IOCTL_DATA_* constants
+#: DeviceIoControl expects.
+_DATA_IN_BY_DIRECTION = {
+    Direction.TO: 0,
+    Direction.FROM: 1,
+    Direction.NONE: 2,
+}
+
+#: Fixed geometry of the passthrough header, resolved once instead of
+#: through ctypes descriptor lookups on every command.
+_SPTD_SIZE = ctypes.sizeof(SCSIPassThroughDirect)
+_SENSE_SIZE = SCSIPassThroughDirectWithBuffer.sense.size
+_SENSE_OFFSET = SCSIPassThroughDirectWithBuffer.sense.offset
+
 
 class WindowsSCSIDevice(SCSIDevice):
     def __enter__(self):
         if self.fd is not None:
             raise IOError("Device is already open.")
 
+        # Bound once so the hot path below doesn't resolve the DLL handle
+        # and the function attributes on every command.
+        kernel32 = self._kernel32 = get_kernel32()
+
         # We can't use the normal approach to opening a file on Windows, as
         # various Python APIs can't handle a device opened without specific
         # flags, see (https://bugs.python.org/issue37074)
-        self.fd = get_kernel32().CreateFileW(
+        self.fd = kernel32.CreateFileW(
             self.path,
             0x80000000 | 0x40000000,  # GENERIC_READ | GENERIC_WRITE
             0x00000001,  # FILE_SHARE_READ
@@ -29,15 +52,31 @@ class WindowsSCSIDevice(SCSIDevice):
             None,
         )
 
-        if self.fd == -1:
+        if self.fd == _INVALID_HANDLE_VALUE:
             raise ctypes.WinError(ctypes.get_last_error())
 
+        # Scratch header reused by every issue_command() call on this
+        # device, so polling loops don't rebuild the passthrough structure
+        # per command. The invariant fields are written once here; only the
+        # per-command fields get patched on each call.
+        self._header = SCSIPassThroughDirectWithBuffer(
+            sptd=SCSIPassThroughDirect(
+                length=_SPTD_SIZE,
+                sense_info_length=_SENSE_SIZE,
+                sense_info_offset=_SENSE_OFFSET,
+            )
+        )
+        self._header_ref = ctypes.byref(self._header)
+        self._header_size = ctypes.sizeof(self._header)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         if self.fd is not None:
-            get_kernel32().CloseHandle(self.fd)
+            self._kernel32.CloseHandle(self.fd)
             self.fd = None
+        # The cached INQUIRY/IDENTIFY responses are only valid while the
+        # device is open - it may be a different disk next time.
+        self.refresh()
         return False
 
     def issue_command(
@@ -48,58 +87,52 @@ class WindowsSCSIDevice(SCSIDevice):
         *,
         timeout: int = 3000,
     ) -> SCSIResponse:
-        # On Windows, the command block is always 16 bytes, but we may be
-        # sending a smaller command. We use a temporary mutable bytearray for
-        # this.
-        cdb = (ctypes.c_ubyte * 16).from_buffer_copy(
-            bytearray(command).ljust(16, b"\x00")  # noqa
-        )
-
         if data is None:
             data = ctypes.create_string_buffer(0)
 
-        header_with_buffer = SCSIPassThroughDirectWithBuffer(
-            sptd=SCSIPassThroughDirect(
-                length=ctypes.sizeof(SCSIPassThroughDirect),
-                data_in={
-                    Direction.TO: 0,
-                    Direction.FROM: 1,
-                    Direction.NONE: 2,
-                }.get(direction),
-                data_transfer_length=ctypes.sizeof(data),
-                data_buffer=ctypes.addressof(data),
-                cdb_length=ctypes.sizeof(command),
-                cdb=cdb,
-                timeout_value=max(timeout // 1000, 1),
-                sense_info_length=SCSIPassThroughDirectWithBuffer.sense.size,
-                sense_info_offset=(
-                    SCSIPassThroughDirectWithBuffer.sense.offset
-                ),
-            )
-        )
+        # Only the fields that vary between commands are patched on the
+        # preallocated header; length and the sense geometry were set once
+        # in __enter__. The sense area is zeroed so a command that returns
+        # no sense doesn't inherit the previous command's.
+        header_with_buffer = self._header
+        ctypes.memset(header_with_buffer.sense, 0, _SENSE_SIZE)
+        sptd = header_with_buffer.sptd
+        # On Windows, the command block is always 16 bytes, but we may be
+        # sending a smaller command - copy it straight into the header's
+        # embedded CDB and zero the tail, rather than staging it through a
+        # temporary bytearray.
+        command_size = ctypes.sizeof(command)
+        ctypes.memset(sptd.cdb, 0, 16)
+        ctypes.memmove(sptd.cdb, ctypes.byref(command), command_size)
+        sptd.data_in = _DATA_IN_BY_DIRECTION[direction]
+        sptd.data_transfer_length = ctypes.sizeof(data)
+        sptd.data_buffer = ctypes.addressof(data)
+        sptd.cdb_length = command_size
+        sptd.timeout_value = max(timeout // 1000, 1)
 
-        result = get_kernel32().DeviceIoControl(
+        # ctypes releases the GIL for the duration of the foreign call, so
+        # threads polling several devices block here concurrently.
+        result = self._kernel32.DeviceIoControl(
             self.fd,
             IOCTL_SCSI_PASS_THROUGH_DIRECT,
-            ctypes.pointer(header_with_buffer),
-            ctypes.sizeof(header_with_buffer),
-            ctypes.pointer(header_with_buffer),
-            ctypes.sizeof(header_with_buffer),
+            self._header_ref,
+            self._header_size,
+            self._header_ref,
+            self._header_size,
             None,
             None,
         )
 
         if result == 0:
             raise ctypes.WinError(ctypes.get_last_error())
-        
-        self.parse_sense(bytearray(header_with_buffer.sense))
+
+        sense = self.parse_sense(header_with_buffer.sense)
 
         return SCSIResponse(
-            succeeded=(
-                header_with_buffer.sptd.scsi_status == 0
-                or header_with_buffer.sptd.scsi_status == 2
-            ),
-            sense=self.parse_sense(bytearray(header_with_buffer.sense)),
+            # GOOD (0) and CONDITION MET (2) are the two success statuses;
+            # they only differ in bit 1, so one mask-and-compare covers both.
+            succeeded=(sptd.scsi_status & ~0x02) == 0,
+            sense=sense,
             platform_header=header_with_buffer,
             command=command,
             bytes_transferred=header_with_buffer.sptd.data_transfer_length,
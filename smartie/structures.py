@@ -1,7 +1,63 @@
+import array
 import ctypes
+import struct
+from functools import cache
 from typing import Any, Dict
 
-from smartie.util import grouper_it
+#: Maps the fixed-width ctypes scalars onto their struct format characters.
+_STRUCT_FORMATS = {
+    ctypes.c_ubyte: "B",
+    ctypes.c_byte: "b",
+    ctypes.c_ushort: "H",
+    ctypes.c_short: "h",
+    ctypes.c_uint32: "I",
+    ctypes.c_int32: "i",
+    ctypes.c_uint64: "Q",
+    ctypes.c_int64: "q",
+}
+
+
+@cache
+def compiled_struct(cls) -> struct.Struct:
+    """
+    Builds (and caches) a :class:`struct.Struct` equivalent to the given
+    packed ctypes.Structure, so callers can unpack every field of a buffer
+    in a single C call instead of going through per-field ctypes
+    descriptors.
+
+    Only packed (``_pack_ = 1``), little-endian structures made of fixed
+    width scalars and ``c_ubyte`` arrays can be represented in a struct
+    format string; anything else (bitfields, nested structures, native
+    alignment) is rejected.
+    """
+    if getattr(cls, "_pack_", None) != 1:
+        raise ValueError(f"{cls.__name__} must be packed (_pack_ = 1).")
+
+    parts = ["<"]
+    for field in cls._fields_:
+        if len(field) == 3:
+            raise ValueError(
+                f"{cls.__name__}.{field[0]} is a bitfield, which can't be"
+                f" expressed in a struct format."
+            )
+
+        name, type_ = field
+        fmt = _STRUCT_FORMATS.get(type_)
+        if fmt is None:
+            if (
+                issubclass(type_, ctypes.Array)
+                and type_._type_ is ctypes.c_ubyte  # noqa
+            ):
+                fmt = f"{type_._length_}s"  # noqa
+            else:
+                raise ValueError(
+                    f"{cls.__name__}.{name} has no struct equivalent."
+                )
+        parts.append(fmt)
+
+    compiled = struct.Struct("".join(parts))
+    assert compiled.size == ctypes.sizeof(cls)
+    return compiled
 
 
 class c_uint128(ctypes.Structure):  # noqa
@@ -19,7 +75,9 @@ class c_uint128(ctypes.Structure):  # noqa
 
     @property
     def value(self) -> int:
-        return (self.high << 64) | self.low
+        # One C-level copy and conversion, rather than two ctypes field
+        # reads plus a shift-and-or on 64-bit ints.
+        return int.from_bytes(bytes(self), "little")
 
     def __int__(self):
         return self.value
@@ -32,14 +90,34 @@ def swap_bytes(src):
     # Weirdly, all the strings in the IDENTIFY response are byte swapped.
     src = bytearray(src)
 
-    for i in range(0, len(src) - 1, 2):
-        src[i] ^= src[i + 1]
-        src[i + 1] ^= src[i]
-        src[i] ^= src[i + 1]
+    # Exchange the even and odd bytes with two C-level slice assignments
+    # rather than a Python loop over every byte. A trailing odd byte (which
+    # never occurs in the fixed-width ATA fields) is left untouched.
+    end = len(src) & ~1
+    src[0:end:2], src[1:end:2] = src[1:end:2], src[0:end:2]
 
     return src
 
 
+#: Every byte value pre-rendered as "0xNN", so formatting a dump is a
+#: table lookup per byte instead of a format-spec parse.
+_HEX = tuple(f"0x{value:02X}" for value in range(256))
+
+
+def ata_string(src) -> str:
+    """
+    Decodes a fixed-width, byte-swapped ATA identification string (such as
+    the model and serial number fields in an IDENTIFY response) into a
+    plain :class:`str`, with the space/NUL padding stripped.
+    """
+    # ATA strings are sequences of 16-bit words with the bytes in each
+    # word reversed - exactly what array.byteswap() undoes, in one C pass.
+    words = array.array("H")
+    words.frombytes(bytes(src))
+    words.byteswap()
+    return words.tobytes().strip(b" \x00").decode("ascii", "replace")
+
+
 def embed_bytes(data: bytes, *, indent=0, char="    ", max_width=80) -> str:
     """
     Pretty-prints `data` in such a way that it can be embedded cleanly in
@@ -55,60 +133,127 @@ def embed_bytes(data: bytes, *, indent=0, char="    ", max_width=80) -> str:
     """
     prefix = char * indent
     line_length = max_width - len(prefix)
+    row_prefix = char * (indent + 1)
+    per_row = line_length // 6
 
+    # Walk the data in contiguous slices rather than through chained
+    # iterators - bytes slicing is a C-level copy and iterating it yields
+    # plain ints for the lookup table.
     lines = "\n".join(
-        "{prefix}{line}".format(
-            prefix=char * (indent + 1),
-            line=", ".join(f"0x{byte:02X}" for byte in row),
-        )
-        for row in grouper_it(line_length // 6, data)
+        row_prefix + ", ".join(_HEX[byte] for byte in data[i:i + per_row])
+        for i in range(0, len(data), per_row)
     )
     return f"{prefix}bytearray([\n{lines}\n{prefix}])"
 
 
-def pprint_structure(s: ctypes.Structure):
+@cache
+def _pprint_plan(cls):
     """
-    Debugging utility method to pretty-print a `ctypes.Structure`.
+    Builds (and caches, per structure class) the ``(name, start, end)``
+    bit ranges :func:`pprint_structure` prints, so the descriptor walk
+    happens once per class rather than on every call.
     """
-    offset = 0
-
-    for field in s._fields_:  # noqa
+    plan = []
+    for field in cls._fields_:  # noqa
+        name = field[0]
+        # The descriptor already knows where ctypes actually placed the
+        # field - summing up declared bitcounts goes wrong as soon as the
+        # layout rules insert padding.
+        descriptor = getattr(cls, name)
         if len(field) == 3:
-            # Found a bitfield.
-            name, type_, bitcount = field
+            # Found a bitfield. The descriptor's size packs the width into
+            # the high 16 bits and the bit offset within the storage unit
+            # into the low 16 bits.
+            start = descriptor.offset * 8 + (descriptor.size & 0xFFFF)
+            end = start + (descriptor.size >> 16)
         else:
-            name, type_ = field
-            bitcount = ctypes.sizeof(type_) * 8
+            start = descriptor.offset * 8
+            end = start + descriptor.size * 8
+        plan.append((name, start, end))
+    return tuple(plan)
+
 
+def pprint_structure(s: ctypes.Structure):
+    """
+    Debugging utility method to pretty-print a `ctypes.Structure`.
+    """
+    for name, start, end in _pprint_plan(type(s)):
         value = getattr(s, name)
         if isinstance(value, ctypes.Array):
+            # One copy of the array, shared by the preview slice and the
+            # full dump below.
+            raw = bytes(value)
             print(
-                f"{name}[{offset}:{offset + bitcount}] = {bytes(value)[:15]!r}"
+                f"{name}[{start}:{end}] = {raw[:15]!r}"
                 f" ({len(value)} bytes)"
             )
-            print(embed_bytes(bytes(value)))
+            print(embed_bytes(raw))
         else:
-            print(f"{name}[{offset}:{offset + bitcount}] = {value!r}")
-        offset += bitcount
+            print(f"{name}[{start}:{end}] = {value!r}")
 
 
-def structure_to_dict(s: ctypes.Structure) -> Dict[str, Any]:
+def _convert_scalar(value):
+    return value
+
+
+def _convert_byte_array(value):
+    # bytes() is a single C-level copy, and list() boxes the ints in
+    # bulk - much cheaper than iterating the ctypes array element by
+    # element.
+    return list(bytes(value))
+
+
+def _convert_generic_array(value):
+    # Arrays of nested structures (and anything else exotic) fall back
+    # to plain iteration.
+    return [v for v in value]
+
+
+@cache
+def _field_plan(cls):
     """
-    Converts a `ctypes.Structure` into a dictionary.
+    Builds (and caches, per structure class) the ``(name, handler)`` pairs
+    :func:`structure_to_dict` runs, so the type introspection happens once
+    per class and conversion is one call per field rather than a chain of
+    isinstance checks.
     """
-    result = {}
+    plan = []
+    for field in cls._fields_:  # noqa
+        name, type_ = field[0], field[1]
+        if issubclass(type_, ctypes.Array):
+            element = type_._type_  # noqa
+            if element is ctypes.c_ubyte:
+                handler = _convert_byte_array
+            elif element in _STRUCT_FORMATS:
+                # Wider scalar elements convert in bulk through the
+                # buffer protocol. The round-trip through bytes()
+                # normalizes away the packed "<H"-style formats ctypes
+                # gives packed arrays, which memoryview.tolist() refuses
+                # to handle.
+                fmt = _STRUCT_FORMATS[element]
 
-    for field in s._fields_:  # noqa
-        name = field[0]
-        value = getattr(s, name)
+                def handler(value, _fmt=fmt):
+                    return memoryview(bytes(value)).cast(_fmt).tolist()
 
-        if isinstance(value, ctypes.Array):
-            result[name] = [v for v in value]
-        elif isinstance(value, c_uint128):
-            result[name] = int(value)
-        elif isinstance(value, ctypes.Structure):
-            result[name] = structure_to_dict(value)
+            else:
+                handler = _convert_generic_array
+        elif issubclass(type_, c_uint128):
+            handler = int
+        elif issubclass(type_, ctypes.Structure):
+            handler = structure_to_dict
         else:
-            result[name] = value
+            # Scalars - including bitfields, which ctypes presents as
+            # plain ints.
+            handler = _convert_scalar
+        plan.append((name, handler))
+    return tuple(plan)
 
-    return result
+
+def structure_to_dict(s: ctypes.Structure) -> Dict[str, Any]:
+    """
+    Converts a `ctypes.Structure` into a dictionary.
+    """
+    return {
+        name: handler(getattr(s, name))
+        for name, handler in _field_plan(type(s))
+    }
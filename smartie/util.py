@@ -2,6 +2,9 @@ import itertools
 
 
 def grouper_it(n, iterable):
+    # Prefer direct slicing when the input is bytes or another sliceable
+    # sequence - the chained iterators this yields cost a __next__ call
+    # per element. This survives for callers with arbitrary iterables.
     it = iter(iterable)
     while True:
         chunk_it = itertools.islice(it, n)
@@ -16,6 +16,9 @@ class MockedSCSIDevice(SCSIDevice):
         super().__init__(*args, **kwargs)
         self._return_data = return_data
         self._return_sense = return_sense
+        # Precomputed once so every mocked command is a single memmove,
+        # without re-measuring the canned response.
+        self._return_len = len(return_data) if return_data else 0
 
     def issue_command(
         self,
@@ -25,15 +28,13 @@ class MockedSCSIDevice(SCSIDevice):
         *,
         timeout: int = 3000,
     ) -> SCSIResponse:
-        if self._return_data:
-            ctypes.memmove(data, self._return_data, len(self._return_data))
+        if self._return_len:
+            ctypes.memmove(data, self._return_data, self._return_len)
 
         return SCSIResponse(
             sense=self._return_sense,
             platform_header=None,
-            bytes_transferred=len(self._return_data)
-            if self._return_data
-            else 0,
+            bytes_transferred=self._return_len,
             succeeded=True,
             command=command,
         )